@@ -1,21 +1,121 @@
 """
 API endpoint for document analysis.
 """
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from app.models.schemas import DocumentAnalysis
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+import anyio
+from fastapi import APIRouter, Request, UploadFile, File, HTTPException
+from app.models.schemas import Clause, DocumentAnalysis
 from app.services.document_loader import DocumentLoader
 from app.services.risk_analyzer import RiskAnalyzer
-from app.core.config import MAX_FILE_SIZE, ALLOWED_EXTENSIONS
+from app.core.pool import create_process_pool
+from app.core.config import (
+    MAX_FILE_SIZE,
+    ALLOWED_EXTENSIONS,
+    ANALYSIS_CACHE_SIZE,
+    THREAD_OFFLOAD_MAX_SIZE,
+)
 
 router = APIRouter()
 
+# Content-addressed LRU of serialized DocumentAnalysis results. The pipeline
+# is deterministic, so identical bytes always produce identical results.
+_analysis_cache: "OrderedDict[str, dict]" = OrderedDict()
+
+
+class _WorkerError(Exception):
+    """Picklable carrier for an HTTPException raised inside a worker."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _analyze_sync(content: bytes, filename: str) -> List[Clause]:
+    """
+    Worker entry point (thread or process pool): stream the document's
+    text page by page straight into the analyzer, so the full text is
+    never materialized.
+    """
+    text_length = 0
+    
+    def pages():
+        nonlocal text_length
+        for page in DocumentLoader.iter_text(content, filename):
+            text_length += len(page.strip())
+            yield page
+    
+    try:
+        clauses = RiskAnalyzer.analyze_document_stream(pages())
+    except HTTPException as e:
+        # HTTPException cannot be unpickled in the parent process
+        raise _WorkerError(e.status_code, e.detail)
+    
+    if text_length < 50:
+        raise _WorkerError(
+            400,
+            "Could not extract sufficient text from document. "
+            "File may be corrupted, image-based, or empty."
+        )
+    
+    return clauses
+
+
+def _cache_key(content: bytes, file_extension: str) -> str:
+    """Key a result by file type and a digest of the upload bytes."""
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return f"{file_extension}:{digest}"
+
+
+def _cache_get(key: str) -> Optional[dict]:
+    """Return a cached analysis and mark it as recently used."""
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+    return cached
+
+
+def _cache_put(key: str, analysis: DocumentAnalysis) -> None:
+    """Store an analysis, evicting the least recently used entries."""
+    _analysis_cache[key] = analysis.model_dump()
+    _analysis_cache.move_to_end(key)
+    while len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+
+
+async def _run_in_pool(request: Request, func, *args):
+    """
+    Run func in the application's process pool. If a worker died (e.g. a
+    parser crash on a malformed file), the pool is unusable from then on,
+    so it is replaced before the error is reported.
+    """
+    pool = request.app.state.pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # Concurrent requests may all see the same broken pool; only the
+        # first one replaces it
+        if request.app.state.pool is pool:
+            request.app.state.pool = create_process_pool()
+            pool.shutdown(wait=False)
+        raise
+
 
 @router.post("/analyze", response_model=DocumentAnalysis)
-async def analyze_document(file: UploadFile = File(...)):
+async def analyze_document(request: Request, file: UploadFile = File(...)):
     """
     Analyze uploaded financial document for risk clauses.
     
+    Parsing and analysis are CPU-bound, so they run together off the event
+    loop (in a thread for small DOCX uploads, otherwise the process pool).
+    
     Args:
+        request: Incoming request (used to reach the process pool)
         file: Uploaded PDF or DOCX file
         
     Returns:
@@ -39,32 +139,45 @@ async def analyze_document(file: UploadFile = File(...)):
     file_content = await file.read()
     if len(file_content) > MAX_FILE_SIZE:
         raise HTTPException(
-            status_code=400,
+            status_code=413,
             detail=f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
         )
     
-    # Reset file pointer for processing
-    await file.seek(0)
+    # Repeat uploads of the same document skip parsing and analysis. Large
+    # uploads are hashed in a thread (hashlib releases the GIL) so the
+    # digest does not block the event loop.
+    if len(file_content) >= THREAD_OFFLOAD_MAX_SIZE:
+        cache_key = await anyio.to_thread.run_sync(
+            _cache_key, file_content, file_extension
+        )
+    else:
+        cache_key = _cache_key(file_content, file_extension)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return DocumentAnalysis(**cached)
     
     try:
-        # Extract text from document
-        text = await DocumentLoader.extract_text(file)
-        
-        if not text or len(text.strip()) < 50:
-            raise HTTPException(
-                status_code=400,
-                detail="Could not extract sufficient text from document. "
-                       "File may be corrupted, image-based, or empty."
+        # Extract and analyze the bytes already read above. Small DOCX
+        # uploads go to a thread to skip pickling; PDFs (PyMuPDF is not
+        # thread-safe) and large uploads go to the process pool.
+        if file_extension == ".docx" and len(file_content) < THREAD_OFFLOAD_MAX_SIZE:
+            clauses = await anyio.to_thread.run_sync(
+                _analyze_sync, file_content, file.filename
+            )
+        else:
+            clauses = await _run_in_pool(
+                request, _analyze_sync, file_content, file.filename
             )
-        
-        # Analyze text for risks
-        clauses = RiskAnalyzer.analyze_document(text)
         
         # Return analysis results
-        return DocumentAnalysis(clauses=clauses)
+        analysis = DocumentAnalysis(clauses=clauses)
+        _cache_put(cache_key, analysis)
+        return analysis
     
     except HTTPException:
         raise
+    except _WorkerError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,6 +1,7 @@
 """
 Application configuration settings.
 """
+import os
 from typing import List
 
 # CORS origins - allow frontend to make requests
@@ -15,7 +16,19 @@ ALLOWED_ORIGINS: List[str] = [
 # File upload settings
 MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
 ALLOWED_EXTENSIONS: List[str] = [".pdf", ".docx"]
+# Largest request body accepted, leaving room for multipart framing
+MAX_REQUEST_SIZE: int = MAX_FILE_SIZE + 64 * 1024
 
 # API settings
 API_PREFIX: str = "/api"
 
+# Worker processes for CPU-bound parsing and analysis
+PROCESS_POOL_WORKERS: int = os.cpu_count() or 1
+# DOCX uploads smaller than this are processed in a worker thread instead,
+# where avoiding the cost of pickling to another process outweighs the GIL.
+# PDFs always use the process pool: PyMuPDF runs MuPDF single-threaded and
+# must not be used from concurrent threads.
+THREAD_OFFLOAD_MAX_SIZE: int = 1 * 1024 * 1024  # 1MB
+
+# Number of analysis results kept in the content-hash cache
+ANALYSIS_CACHE_SIZE: int = 256
@@ -0,0 +1,18 @@
+"""
+Process pool used for CPU-bound document parsing and analysis.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from app.core.config import PROCESS_POOL_WORKERS
+
+
+def create_process_pool() -> ProcessPoolExecutor:
+    """
+    Create the worker pool. Workers are spawned rather than forked, since
+    forking a process with running threads (uvicorn, anyio workers, MuPDF,
+    sklearn) can leave the children deadlocked.
+    """
+    return ProcessPoolExecutor(
+        max_workers=PROCESS_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
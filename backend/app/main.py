@@ -1,19 +1,59 @@
 """
 FastAPI application entry point.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.analyze import router as analyze_router
-from app.core.config import ALLOWED_ORIGINS, API_PREFIX
+from app.core.pool import create_process_pool
+from app.core.config import (
+    ALLOWED_ORIGINS,
+    API_PREFIX,
+    MAX_FILE_SIZE,
+    MAX_REQUEST_SIZE,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the process pool used for CPU-bound document work."""
+    app.state.pool = create_process_pool()
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(wait=True)
+
 
 # Create FastAPI application
 app = FastAPI(
     title="Financial Document Risk Analysis API",
     description="Backend API for analyzing financial documents and identifying risk clauses",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """
+    Reject oversized uploads from the Content-Length header, before the
+    multipart body is read and spooled. The endpoint still checks the
+    actual size, since the header can be absent or wrong.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_SIZE:
+        return ORJSONResponse(
+            status_code=413,
+            content={
+                "detail": f"File size exceeds maximum allowed size of {MAX_FILE_SIZE / (1024*1024):.1f}MB"
+            },
+        )
+    return await call_next(request)
+
+
+# Configure CORS (added after the size limit so it wraps its responses too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
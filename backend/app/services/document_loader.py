@@ -3,8 +3,13 @@ Document loading and text extraction service.
 Supports PDF and DOCX file formats.
 """
 import io
-from typing import Optional
-from fastapi import UploadFile, HTTPException
+from typing import Iterator, Optional
+from fastapi import HTTPException
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
 
 try:
     from pypdf import PdfReader
@@ -25,12 +30,13 @@ class DocumentLoader:
     """Handles extraction of text from various document formats."""
     
     @staticmethod
-    async def extract_text(file: UploadFile) -> str:
+    def extract_text(content: bytes, filename: str) -> str:
         """
-        Extract text from uploaded file.
+        Extract text from uploaded file content.
         
         Args:
-            file: FastAPI UploadFile object
+            content: Raw bytes of the uploaded file (already read by the caller)
+            filename: Original filename, used to detect the format
             
         Returns:
             Extracted text content
@@ -38,17 +44,31 @@ class DocumentLoader:
         Raises:
             HTTPException: If file format is unsupported or extraction fails
         """
-        # Read file content
-        content = await file.read()
-        file_extension = file.filename.split('.')[-1].lower() if file.filename else ''
+        return "\n\n".join(DocumentLoader.iter_text(content, filename))
+    
+    @staticmethod
+    def iter_text(content: bytes, filename: str) -> Iterator[str]:
+        """
+        Lazily extract text from uploaded file content, one chunk at a time.
+        PDFs yield one chunk per page so the whole document text is never
+        held in memory; DOCX yields a single chunk.
         
-        # Reset file pointer for potential re-reading
-        await file.seek(0)
+        Args:
+            content: Raw bytes of the uploaded file (already read by the caller)
+            filename: Original filename, used to detect the format
+            
+        Returns:
+            Iterator over extracted text chunks
+            
+        Raises:
+            HTTPException: If file format is unsupported or extraction fails
+        """
+        file_extension = filename.split('.')[-1].lower() if filename else ''
         
         if file_extension == 'pdf':
-            return DocumentLoader._extract_from_pdf(content)
+            return DocumentLoader._iter_pdf_pages(content)
         elif file_extension == 'docx':
-            return DocumentLoader._extract_from_docx(content)
+            return iter([DocumentLoader._extract_from_docx(content)])
         else:
             raise HTTPException(
                 status_code=400,
@@ -56,35 +76,33 @@ class DocumentLoader:
             )
     
     @staticmethod
-    def _extract_from_pdf(content: bytes) -> str:
-        """Extract text from PDF file."""
-        if PdfReader is None:
+    def _iter_pdf_pages(content: bytes) -> Iterator[str]:
+        """
+        Yield the text of each PDF page.
+        Uses PyMuPDF when available, falling back to pypdf.
+        """
+        if fitz is None and PdfReader is None:
             raise HTTPException(
                 status_code=500,
                 detail="PDF processing library not available"
             )
         
         try:
-            pdf_file = io.BytesIO(content)
-            reader = PdfReader(pdf_file)
+            if fitz is not None:
+                pages = DocumentLoader._iter_pages_pymupdf(content)
+            else:
+                pages = DocumentLoader._iter_pages_pypdf(content)
             
-            text_parts = []
-            for page in reader.pages:
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                except Exception as e:
-                    # Continue with other pages if one fails
-                    continue
+            found_text = False
+            for page_text in pages:
+                found_text = True
+                yield page_text
             
-            if not text_parts:
+            if not found_text:
                 raise HTTPException(
                     status_code=400,
                     detail="Could not extract text from PDF. File may be corrupted or image-based."
                 )
-            
-            return "\n\n".join(text_parts)
         
         except HTTPException:
             raise
@@ -94,6 +112,37 @@ class DocumentLoader:
                 detail=f"Error processing PDF: {str(e)}"
             )
     
+    @staticmethod
+    def _iter_pages_pymupdf(content: bytes) -> Iterator[str]:
+        """Yield per-page text with PyMuPDF (MuPDF C engine)."""
+        doc = fitz.open(stream=content, filetype="pdf")
+        try:
+            for page in doc:
+                try:
+                    page_text = page.get_text("text")
+                except Exception:
+                    # Continue with other pages if one fails
+                    continue
+                if page_text:
+                    yield page_text
+        finally:
+            doc.close()
+    
+    @staticmethod
+    def _iter_pages_pypdf(content: bytes) -> Iterator[str]:
+        """Yield per-page text with pypdf (pure-Python fallback)."""
+        pdf_file = io.BytesIO(content)
+        reader = PdfReader(pdf_file)
+        
+        for page in reader.pages:
+            try:
+                page_text = page.extract_text()
+            except Exception:
+                # Continue with other pages if one fails
+                continue
+            if page_text:
+                yield page_text
+    
     @staticmethod
     def _extract_from_docx(content: bytes) -> str:
         """Extract text from DOCX file."""
@@ -1,10 +1,20 @@
 import re
 import uuid
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Dict, Tuple, Optional, Set
 from app.models.schemas import Clause
 from app.utils.text_cleaner import extract_numbers
 from app.services.ml_classifier import ml_classifier
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 class RiskAnalyzer:
     NEGATIVE_INDICATORS = [
@@ -145,15 +155,35 @@ class RiskAnalyzer:
         if not text or len(text.strip()) < 50:
             return []
 
+        return RiskAnalyzer.analyze_document_stream([text])
+
+    @staticmethod
+    def analyze_document_stream(pages: Iterable[str]) -> List[Clause]:
+        """
+        Analyze a document supplied as an iterable of text chunks (e.g. PDF
+        pages), so only one chunk needs to be in memory at a time. Chunks
+        are treated as separated by a paragraph break.
+        """
         from app.utils.text_cleaner import split_into_clauses
 
-        clauses = split_into_clauses(text, min_length=30)
+        clauses = (
+            clause
+            for page in pages
+            for clause in split_into_clauses(page, min_length=30)
+        )
         identified_risks: List[Clause] = []
-        seen_clauses: set = set()
+        # Exact (clause prefix, category) keys: no hash collisions, no
+        # concatenated strings
+        seen_clauses: Set[Tuple[str, str]] = set()
 
-        for clause_text in clauses:
-            clause_lower = clause_text.lower()
-            clause_id = str(uuid.uuid4())
+        # One random prefix per document; a counter keeps ids unique within it
+        id_prefix = uuid.uuid4().hex[:16]
+
+        for index, clause_text in enumerate(clauses):
+            clause_id = f"{id_prefix}-{index:04x}"
+            # Sliced once per clause, shared by every match below
+            clause_fp = clause_text[:100]
+            clause_preview = clause_text[:500]
 
             # ✅ ML prediction (SAFE location)
             try:
@@ -167,10 +197,16 @@ class RiskAnalyzer:
                 and ml_confidence > 0.80
             )
 
-            for pattern_key, pattern_config in RiskAnalyzer.RISK_PATTERNS.items():
+            # Only categories whose literal keywords occur can match
+            candidates = _candidate_patterns(clause_text)
+
+            for pattern_key, pattern_config in _PATTERNS_ORDERED:
+                if pattern_key not in candidates:
+                    continue
+
                 matches = RiskAnalyzer._check_pattern(
-                    clause_lower,
                     clause_text,
+                    pattern_key,
                     pattern_config,
                 )
 
@@ -184,17 +220,15 @@ class RiskAnalyzer:
                             " ML analysis also indicates elevated risk."
                         )
 
-                    clause_hash = hash(
-                        clause_text[:100] + pattern_config["risk_type"]
-                    )
-                    if clause_hash in seen_clauses:
+                    clause_key = (clause_fp, pattern_key)
+                    if clause_key in seen_clauses:
                         continue
-                    seen_clauses.add(clause_hash)
+                    seen_clauses.add(clause_key)
 
                     identified_risks.append(
                         Clause(
                             clause_id=clause_id,
-                            text=clause_text[:500],
+                            text=clause_preview,
                             risk_type=pattern_config["risk_type"],
                             severity=severity,
                             explanation=explanation,
@@ -203,14 +237,14 @@ class RiskAnalyzer:
                     break
             
             if ml_high_confidence:
-                clause_hash = hash(clause_text[:100] + "ml_high_risk")
-                if clause_hash not in seen_clauses:
-                    seen_clauses.add(clause_hash)
+                clause_key = (clause_fp, "ml_high_risk")
+                if clause_key not in seen_clauses:
+                    seen_clauses.add(clause_key)
                     
                     identified_risks.append(
                         Clause(
                             clause_id=clause_id,
-                            text=clause_text[:500],
+                            text=clause_preview,
                             risk_type="ML Detected Risk",
                             severity="High",
                             explanation="ML model flagged this clause as high risk.",
@@ -221,31 +255,132 @@ class RiskAnalyzer:
     
     @staticmethod
     def _check_pattern(
-    clause_lower: str,
     clause_text: str,
+    pattern_key: str,
     pattern_config: Dict,
 ) -> Optional[Tuple[str, str]]:
-        keyword_found = any(
-        re.search(keyword, clause_lower)
-        for keyword in pattern_config["keywords"]
-        )
+        # Keyword patterns are case-insensitive, so no lowercased copy is needed
+        keyword_match = _COMPILED["keywords"][pattern_key].search(clause_text)
 
-        if not keyword_found:
+        if keyword_match is None:
             return None
 
         severity = pattern_config.get("base_severity", "Medium")
-        explanation = f"This clause indicates {pattern_config['risk_type']}."
+        explanation = _EXPLANATIONS[pattern_key]
 
         if "threshold" in pattern_config:
-            numbers = extract_numbers(clause_text)
-            for num in numbers:
-                if num > pattern_config["threshold"]:
-                    severity = "High"
-                    explanation = (
-                        f"Interest rate {num}% exceeds safe threshold "
-                        f"of {pattern_config['threshold']}%."
-                    )
-                    break
+            threshold = pattern_config["threshold"]
+            num = next(
+                (n for n in extract_numbers(clause_text) if n > threshold),
+                None,
+            )
+            if num is not None:
+                severity = "High"
+                explanation = (
+                    f"Interest rate {num}% exceeds safe threshold "
+                    f"of {threshold}%."
+                )
         
         return severity, explanation
 
+
+# Categories in descending base severity (declaration order within a
+# level), so a clause matching several categories reports the most severe
+_SEVERITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+_PATTERNS_ORDERED: List[Tuple[str, Dict]] = sorted(
+    RiskAnalyzer.RISK_PATTERNS.items(),
+    key=lambda item: _SEVERITY_RANK[item[1].get("base_severity", "Medium")],
+)
+
+
+# Default explanation per category, built once rather than on every match
+_EXPLANATIONS: Dict[str, str] = {
+    pattern_key: f"This clause indicates {pattern_config['risk_type']}."
+    for pattern_key, pattern_config in RiskAnalyzer.RISK_PATTERNS.items()
+}
+
+
+def _compile_keywords(keywords: List[str]):
+    """
+    Compile a category's keywords into one case-insensitive alternation.
+    Uses RE2 (linear-time C++ engine) when available, otherwise re.
+    """
+    union = "|".join(f"(?:{keyword})" for keyword in keywords)
+    if re2 is not None:
+        # RE2 takes no flags argument; case-insensitivity goes inline
+        return re2.compile(f"(?i){union}")
+    return re.compile(union, re.IGNORECASE)
+
+
+# Patterns are compiled once at import so the per-clause hot path never
+# goes back through re's compile cache. Each category's keywords are merged
+# into a single alternation so a clause is scanned once per category.
+_COMPILED: Dict[str, object] = {
+    "keywords": {
+        pattern_key: _compile_keywords(pattern_config["keywords"])
+        for pattern_key, pattern_config in RiskAnalyzer.RISK_PATTERNS.items()
+    },
+}
+
+
+def _required_literal(keyword: str) -> Optional[str]:
+    """
+    Return the longest literal run that every match of a keyword regex
+    must contain, or None if the pattern has no plain-text run.
+    """
+    fragments = re.split(
+        r"\\[a-zA-Z][+*?]?|\[[^\]]*\][+*?]?|\(\?:[^)]*\)[+*?]?", keyword
+    )
+    literals = [
+        fragment for fragment in fragments
+        if fragment and not re.search(r"[\\.^$*+?()\[\]{}|]", fragment)
+    ]
+    return max(literals, key=len).lower() if literals else None
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton mapping each keyword's required literal
+    to the categories that use it. Categories with a keyword lacking such a
+    literal cannot be prescreened and are always checked.
+    """
+    literal_owners: Dict[str, Set[str]] = {}
+    always_checked: Set[str] = set()
+
+    for pattern_key, pattern_config in RiskAnalyzer.RISK_PATTERNS.items():
+        for keyword in pattern_config["keywords"]:
+            literal = _required_literal(keyword)
+            if literal is None:
+                always_checked.add(pattern_key)
+            else:
+                literal_owners.setdefault(literal, set()).add(pattern_key)
+
+    automaton = ahocorasick.Automaton()
+    for literal, owners in literal_owners.items():
+        automaton.add_word(literal, frozenset(owners))
+    automaton.make_automaton()
+    return automaton, frozenset(always_checked)
+
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON, _ALWAYS_CHECKED = _build_keyword_automaton()
+else:
+    _KEYWORD_AUTOMATON, _ALWAYS_CHECKED = None, frozenset()
+
+_ALL_PATTERNS = frozenset(RiskAnalyzer.RISK_PATTERNS)
+
+
+def _candidate_patterns(clause_text: str) -> Set[str]:
+    """
+    Single-pass prescreen: the set of categories whose keywords could
+    match the clause. Without pyahocorasick every category is a candidate.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        return _ALL_PATTERNS
+
+    # The automaton is case-sensitive, so it is the one consumer that
+    # needs a lowercased copy of the clause
+    candidates = set(_ALWAYS_CHECKED)
+    for _, owners in _KEYWORD_AUTOMATON.iter(clause_text.lower()):
+        candidates |= owners
+    return candidates
@@ -4,6 +4,12 @@ Text cleaning and normalization utilities.
 import re
 from typing import List
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARAGRAPH_RE = re.compile(r'\n\s*\n+')
+_SENTENCE_RE = re.compile(r'(?=\S)(?:.*?[.!?]+(?= |$)|.+$)')
+# Percentages match anywhere (e.g. "APR24%"); plain numbers need word boundaries
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)\s*%|\b(\d+\.?\d*)\b')
+
 
 def clean_text(text: str) -> str:
     """
@@ -13,13 +19,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    
-    return text
+    # Replace multiple whitespace with single space, trim the ends
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def split_into_clauses(text: str, min_length: int = 50) -> List[str]:
@@ -37,55 +38,35 @@ def split_into_clauses(text: str, min_length: int = 50) -> List[str]:
     if not text:
         return []
     
-    # Split on sentence boundaries (period, exclamation, question mark)
-    # Also split on paragraph breaks (double newline)
-    clauses = []
-    
-    # First, split on paragraph breaks
-    paragraphs = re.split(r'\n\s*\n+', text)
+    clauses: List[str] = []
     
-    for paragraph in paragraphs:
+    # First, split on paragraph breaks (double newline)
+    for paragraph in _PARAGRAPH_RE.split(text):
         paragraph = clean_text(paragraph)
         if len(paragraph) < min_length:
             continue
-            
-        # Split paragraph into sentences
-        sentences = re.split(r'([.!?]+(?:\s+|$))', paragraph)
         
-        current_clause = ""
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            if i + 1 < len(sentences):
-                sentence += sentences[i + 1]
-            
-            sentence = clean_text(sentence)
-            if not sentence:
-                continue
-            
-            # If sentence is long enough, make it a clause
+        # Short sentences are accumulated until they reach min_length
+        pending: List[str] = []
+        pending_length = 0
+        
+        # Sentences end at [.!?] followed by whitespace or end of paragraph
+        for sentence in _SENTENCE_RE.findall(paragraph):
             if len(sentence) >= min_length:
-                if current_clause:
-                    clauses.append(current_clause)
-                    current_clause = ""
+                # Any pending fragment is still too short to keep
+                pending = []
+                pending_length = 0
                 clauses.append(sentence)
-            else:
-                # Accumulate short sentences
-                if current_clause:
-                    current_clause += " " + sentence
-                else:
-                    current_clause = sentence
-                
-                # If accumulated clause is long enough, add it
-                if len(current_clause) >= min_length:
-                    clauses.append(current_clause)
-                    current_clause = ""
-        
-        # Add remaining accumulated clause
-        if current_clause and len(current_clause) >= min_length:
-            clauses.append(current_clause)
+                continue
+            
+            pending_length += len(sentence) + (1 if pending else 0)
+            pending.append(sentence)
+            if pending_length >= min_length:
+                clauses.append(' '.join(pending))
+                pending = []
+                pending_length = 0
     
-    # Filter out very short clauses
-    return [c for c in clauses if len(c) >= min_length]
+    return clauses
 
 
 def extract_numbers(text: str) -> List[float]:
@@ -93,23 +74,15 @@ def extract_numbers(text: str) -> List[float]:
     Extract all numeric values (including percentages) from text.
     
     Returns:
-        List of extracted numbers
+        List of extracted numbers, percentages first
     """
-    # Match percentages (e.g., "18%", "18.5%")
-    percentage_pattern = r'(\d+\.?\d*)\s*%'
-    percentages = re.findall(percentage_pattern, text)
+    # A single pass finds every number, percentages in the first group
+    percentages: List[float] = []
+    numbers: List[float] = []
+    for percent_str, num_str in _NUMBER_RE.findall(text):
+        if percent_str:
+            percentages.append(float(percent_str))
+        else:
+            numbers.append(float(num_str))
     
-    # Match regular numbers (e.g., "18", "18.5")
-    number_pattern = r'\b(\d+\.?\d*)\b'
-    numbers = re.findall(number_pattern, text)
-    
-    # Convert to floats
-    all_numbers = []
-    for num_str in percentages + numbers:
-        try:
-            all_numbers.append(float(num_str))
-        except ValueError:
-            continue
-    
-    return all_numbers
-
+    return percentages + numbers
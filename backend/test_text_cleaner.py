@@ -0,0 +1,11 @@
+from app.utils.text_cleaner import extract_numbers
+
+
+def test_percentages_glued_to_words():
+    assert extract_numbers("APR24%") == [24.0]
+    assert extract_numbers("rate_21%") == [21.0]
+
+
+def test_percentages_listed_first_without_duplicates():
+    text = "Within 30 days, interest rate of 24 % applies, 18.5%."
+    assert extract_numbers(text) == [24.0, 18.5, 30.0]